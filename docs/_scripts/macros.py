@@ -3,6 +3,7 @@
 
 """This module defines macros for use in Markdown files."""
 
+from collections.abc import Callable
 from typing import Any
 
 import markdown as md
@@ -49,19 +50,23 @@ def _hook_macros_plugin(env: macros.MacrosPlugin) -> None:
     # get the `update_env` method of the Python handler
     update_env = python_handler.update_env
 
+    # the original filters of the env, captured after `update_env` sets them
+    originals: dict[str, Callable[..., Any]] = {}
+
+    # build a chimera made of macros+mkdocstrings
+    def render_convert(markdown: str, *args: Any, **kwargs: Any) -> Any:
+        return originals["convert_markdown"](env.render(markdown), *args, **kwargs)
+
     # override the `update_env` method of the Python handler
     def patched_update_env(markdown: md.Markdown, config: dict[str, Any]) -> None:
         update_env(markdown, config)
 
-        # get the `convert_markdown` filter of the env
-        convert_markdown = python_handler.env.filters["convert_markdown"]
-
-        # build a chimera made of macros+mkdocstrings
-        def render_convert(markdown: str, *args: Any, **kwargs: Any) -> Any:
-            return convert_markdown(env.render(markdown), *args, **kwargs)
-
-        # patch the filter
-        python_handler.env.filters["convert_markdown"] = render_convert
+        # patch the filter, unless `update_env` left our patched filter in place, in
+        # which case wrapping it again would render the macros twice
+        filters = python_handler.env.filters
+        if filters["convert_markdown"] is not render_convert:
+            originals["convert_markdown"] = filters["convert_markdown"]
+            filters["convert_markdown"] = render_convert
 
     # patch the method
     python_handler.update_env = patched_update_env
@@ -145,6 +145,10 @@ from ._generic import MappedMessageT_co, ReceiverMessageT_co
 class Receiver(ABC, Generic[ReceiverMessageT_co]):
     """An endpoint to receive messages."""
 
+    # This is empty so subclasses can use `__slots__` to avoid having a `__dict__`.
+    # Subclasses not defining `__slots__` will still get a `__dict__` as usual.
+    __slots__ = ()
+
     async def __anext__(self) -> ReceiverMessageT_co:
         """Await the next message in the async iteration over received messages.
 
@@ -133,7 +133,7 @@ exception that was raised by the receiver.
 
 import asyncio
 from collections.abc import AsyncIterator
-from typing import Any, Generic, TypeGuard
+from typing import Any, Generic, TypeGuard, final
 
 from ._exceptions import Error
 from ._generic import ReceiverMessageT_co
@@ -151,6 +151,15 @@ class _EmptyResult:
         return "<empty>"
 
 
+_EMPTY_RESULT = _EmptyResult()
+"""The sentinel used by `Selected` instances without a message.
+
+The sentinel is stateless, so a single instance is shared to avoid creating a new one
+for every selected receiver.
+"""
+
+
+@final
 class Selected(Generic[ReceiverMessageT_co]):
     """A result of a [`select()`][frequenz.channels.select] iteration.
 
@@ -180,7 +189,7 @@ class Selected(Generic[ReceiverMessageT_co]):
         self._recv: Receiver[ReceiverMessageT_co] = receiver
         """The receiver that was selected."""
 
-        self._message: ReceiverMessageT_co | _EmptyResult = _EmptyResult()
+        self._message: ReceiverMessageT_co | _EmptyResult = _EMPTY_RESULT
         """The message that was received.
 
         If there was an exception while receiving the message, then this will be `None`.
@@ -431,23 +440,30 @@ async def select(*receivers: Receiver[Any]) -> AsyncIterator[Selected[Any]]:
             pending.add(asyncio.create_task(recv.ready(), name=name))
 
         while pending:
-            done, pending = await asyncio.wait(
-                pending, return_when=asyncio.FIRST_COMPLETED
-            )
+            # Tasks can finish while the user is handling the previously selected
+            # receivers, so we collect those first to avoid an extra trip through the
+            # event loop, and only wait if none of them are ready.
+            done = {task for task in pending if task.done()}
+            if done:
+                pending -= done
+            else:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
 
             for task in done:
                 receiver_active: bool = True
                 name = task.get_name()
                 recv = receivers_map[name]
                 if exception := task.exception():
-                    match exception:
-                        case asyncio.CancelledError():
-                            # If the receiver was cancelled, then it means we want to
-                            # exit the select loop, so we handle the receiver but we
-                            # don't add it back to the pending list.
-                            receiver_active = False
-                        case _ as exc:
-                            raise SelectError(f"Error while selecting {recv}") from exc
+                    if not isinstance(exception, asyncio.CancelledError):
+                        raise SelectError(
+                            f"Error while selecting {recv}"
+                        ) from exception
+                    # If the receiver was cancelled, then it means we want to exit
+                    # the select loop, so we handle the receiver but we don't add it
+                    # back to the pending list.
+                    receiver_active = False
 
                 selected = Selected(recv)
                 yield selected
@@ -478,14 +494,19 @@ async def _stop_pending_tasks(pending: set[asyncio.Task[bool]]) -> None:
     if pending:
         for task in pending:
             task.cancel()
-        done, pending = await asyncio.wait(pending)
-        assert not pending
-        exceptions: list[BaseException] = []
-        for task in done:
-            if task.cancelled():
-                continue
-            if exception := task.exception():
-                exceptions.append(exception)
+        # `gather()` collects all the results (and exceptions) in one go, so we don't
+        # need to build the done/pending sets nor query each task afterwards.
+        # Cancellations are expected here, so they are not reported.
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        # Drop the references to the finished tasks as soon as possible, the caller's
+        # frame could be kept alive by a traceback if we raise below.
+        pending.clear()
+        exceptions: list[BaseException] = [
+            result
+            for result in results
+            if isinstance(result, BaseException)
+            and not isinstance(result, asyncio.CancelledError)
+        ]
         if exceptions:
             # If the select loop is interrupted by a break or exception, then this
             # exception will be actually swallowed, as the select() async generator
@@ -20,6 +20,7 @@ This module contains the following:
 
 import asyncio
 import pathlib
+import weakref
 from collections import abc
 from dataclasses import dataclass
 from enum import Enum
@@ -114,6 +115,17 @@ class FileWatcher(Receiver[Event]):
         ```
     """
 
+    __slots__ = (
+        "_event_types",
+        "_changes_to_watch",
+        "_stop_event",
+        "_paths",
+        "_awatch",
+        "_awatch_stopped_exc",
+        "_changes",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         paths: list[pathlib.Path | str],
@@ -126,10 +138,19 @@ class FileWatcher(Receiver[Event]):
             event_types: The types of events to watch for. Defaults to watch for
                 all event types.
         """
-        self.event_types: frozenset[EventType] = frozenset(event_types)
+        self._event_types: frozenset[EventType]
         """The types of events to watch for."""
 
+        self._changes_to_watch: frozenset[Change]
+        """The `watchfiles` changes matching `event_types`, to filter events quickly."""
+
+        self.event_types = frozenset(event_types)
+
         self._stop_event: asyncio.Event = asyncio.Event()
+        # We need to set the stop event when this file watcher is garbage collected to
+        # make sure that the awatch background task is stopped. The finalizer only
+        # references the event, so it doesn't keep this file watcher alive.
+        weakref.finalize(self, self._stop_event.set)
         self._paths: list[pathlib.Path] = [
             path if isinstance(path, pathlib.Path) else pathlib.Path(path)
             for path in paths
@@ -140,6 +161,23 @@ class FileWatcher(Receiver[Event]):
         self._awatch_stopped_exc: Exception | None = None
         self._changes: set[FileChange] = set()
 
+    @property
+    def event_types(self) -> frozenset[EventType]:
+        """The types of events to watch for."""
+        return self._event_types
+
+    @event_types.setter
+    def event_types(self, event_types: frozenset[EventType]) -> None:
+        """Set the types of events to watch for.
+
+        Args:
+            event_types: The types of events to watch for.
+        """
+        self._event_types = frozenset(event_types)
+        self._changes_to_watch = frozenset(
+            event_type.value for event_type in self._event_types
+        )
+
     def _filter_events(
         self,
         change: Change,
@@ -154,13 +192,7 @@ class FileWatcher(Receiver[Event]):
         Returns:
             Whether the event should be notified.
         """
-        return change in [event_type.value for event_type in self.event_types]
-
-    def __del__(self) -> None:
-        """Finalize this file watcher."""
-        # We need to set the stop event to make sure that the awatch background task
-        # is stopped.
-        self._stop_event.set()
+        return change in self._changes_to_watch
 
     async def ready(self) -> bool:
         """Wait until the receiver is ready with a message or an error.
@@ -105,19 +105,28 @@ from datetime import timedelta
 from ._receiver import Receiver, ReceiverStoppedError
 
 
-def _to_microseconds(time: float | timedelta) -> int:
-    """Convert a time or a timedelta to microseconds.
+def _to_microseconds(time: timedelta) -> int:
+    """Convert a timedelta to microseconds.
 
     Args:
-        time: The time to convert. If it is a `float`, it is assumed to be in
-            seconds.
+        time: The timedelta to convert.
 
     Returns:
         The time in microseconds.
     """
-    if isinstance(time, timedelta):
-        time = time.total_seconds()
-    return round(time * 1_000_000)
+    # Use integer arithmetic so the conversion is exact, `timedelta` already has
+    # microseconds resolution.
+    return (time.days * 86_400 + time.seconds) * 1_000_000 + time.microseconds
+
+
+def _set_result_unless_done(future: asyncio.Future[None]) -> None:
+    """Set the result of a future, unless it is already done.
+
+    Args:
+        future: The future to set the result of.
+    """
+    if not future.done():
+        future.set_result(None)
 
 
 class MissedTickPolicy(abc.ABC):
@@ -153,6 +162,8 @@ class MissedTickPolicy(abc.ABC):
         ```
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def calculate_next_tick_time(
         self, *, interval: int, scheduled_tick_time: int, now: int
@@ -225,6 +236,8 @@ class TriggerAllMissed(MissedTickPolicy):
         </center>
     """
 
+    __slots__ = ()
+
     def calculate_next_tick_time(
         self, *, now: int, scheduled_tick_time: int, interval: int
     ) -> int:
@@ -290,6 +303,8 @@ class SkipMissedAndResync(MissedTickPolicy):
         </center>
     """
 
+    __slots__ = ()
+
     def calculate_next_tick_time(
         self, *, now: int, scheduled_tick_time: int, interval: int
     ) -> int:
@@ -359,6 +374,8 @@ class SkipMissedAndDrift(MissedTickPolicy):
         </center>
     """
 
+    __slots__ = ("_tolerance",)
+
     def __init__(self, *, delay_tolerance: timedelta = timedelta(0)):
         """Initialize this policy.
 
@@ -466,6 +483,17 @@ class Timer(Receiver[timedelta]):
     depending on the chosen policy.
     """
 
+    __slots__ = (
+        "_interval",
+        "_missed_tick_policy",
+        "_loop",
+        "_stopped",
+        "_next_tick_time",
+        "_current_drift",
+        "_wakeups",
+        "__weakref__",
+    )
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         interval: timedelta,
@@ -494,8 +522,8 @@ class Timer(Receiver[timedelta]):
             start_delay: The delay before the timer should start. If `auto_start` is
                 `False`, an exception is raised. This has microseconds resolution,
                 anything smaller than a microsecond means no delay.
-            loop: The event loop to use to track time. If `None`,
-                `asyncio.get_running_loop()` will be used.
+            loop: The event loop to use to track time and to schedule the timer
+                ticks. If `None`, `asyncio.get_running_loop()` will be used.
 
         Raises:
             RuntimeError: If it was called without a loop and there is no
@@ -552,13 +580,20 @@ class Timer(Receiver[timedelta]):
         be started as soon as it is used.
         """
 
-        self._current_drift: timedelta | None = None
+        self._current_drift: int | None = None
         """The difference between `_next_msg_time` and the triggered time.
 
-        This is calculated by `ready()` but is returned by `consume()`. If
-        `None` it means `ready()` wasn't called and `consume()` will assert.
-        `consume()` will set it back to `None` to tell `ready()` that it needs
-        to wait again.
+        This is calculated by `ready()` in microseconds, but is returned by
+        `consume()` as a `timedelta`. If `None` it means `ready()` wasn't called
+        and `consume()` will assert. `consume()` will set it back to `None` to
+        tell `ready()` that it needs to wait again.
+        """
+
+        self._wakeups: set[asyncio.Future[None]] = set()
+        """The futures the pending `ready()` calls are waiting on.
+
+        Each one is resolved when the next tick is due, or earlier by `reset()` and
+        `stop()`, so all `ready()` calls can react to the new timer state immediately.
         """
 
         if auto_start:
@@ -607,20 +642,25 @@ class Timer(Receiver[timedelta]):
         self._stopped = False
         self._next_tick_time = self._now() + start_delay_ms + self._interval
         self._current_drift = None
+        self._wake_up_ready()
 
     def stop(self) -> None:
         """Stop the timer.
 
-        Once `stop` has been called, all subsequent calls to `ready()` will
-        immediately return False and calls to `consume()` / `receive()` or any
-        use of the async iterator interface will raise
-        a `ReceiverStoppedError`.
+        Once `stop` has been called, all subsequent calls to `ready()` (including
+        a call that is currently waiting for the next tick) will immediately return
+        False and calls to `consume()` / `receive()` or any use of the async
+        iterator interface will raise a `ReceiverStoppedError`.
 
         You can restart the timer with `reset()`.
         """
         self._stopped = True
-        # We need to make sure it's not None, otherwise `ready()` will start it
-        self._next_tick_time = self._now()
+        # We need to make sure it's not None, otherwise `ready()` will start it. The
+        # actual value doesn't matter, `reset()` sets a new one when restarting, so we
+        # don't need to read the clock here.
+        if self._next_tick_time is None:
+            self._next_tick_time = 0
+        self._wake_up_ready()
 
     # We need a noqa here because the docs have a Raises section but the documented
     # exceptions are raised indirectly.
@@ -660,19 +700,33 @@ class Timer(Receiver[timedelta]):
         time_to_next_tick = self._next_tick_time - now
 
         # If we didn't reach the tick yet, sleep until we do.
-        # We need to do this in a loop also reacting to the reset event, as the timer
-        # could be reset while we are sleeping, in which case we need to recalculate
+        # We need to do this in a loop, as the timer could be reset or stopped while we
+        # are sleeping (which wakes us up early), in which case we need to recalculate
         # the time to the next tick and try again.
         while time_to_next_tick > 0:
-            await asyncio.sleep(time_to_next_tick / 1_000_000)
+            # We schedule the wake up directly in the timer's loop instead of using
+            # `asyncio.sleep()`, to avoid the extra coroutine and running loop lookup
+            # on every tick. We use the absolute tick time, as `call_later()` would
+            # read the loop's clock again only to convert it back.
+            wakeup = self._loop.create_future()
+            self._wakeups.add(wakeup)
+            handle = self._loop.call_at(
+                self._next_tick_time / 1_000_000, _set_result_unless_done, wakeup
+            )
+            try:
+                await wakeup
+            finally:
+                handle.cancel()
+                self._wakeups.discard(wakeup)
+
+            # If a stop was explicitly requested during the sleep, we bail out.
+            if self._stopped:
+                return False
+
             now = self._now()
             time_to_next_tick = self._next_tick_time - now
 
-        # If a stop was explicitly requested during the sleep, we bail out.
-        if self._stopped:
-            return False
-
-        self._current_drift = timedelta(microseconds=now - self._next_tick_time)
+        self._current_drift = now - self._next_tick_time
         self._next_tick_time = self._missed_tick_policy.calculate_next_tick_time(
             now=now,
             scheduled_tick_time=self._next_tick_time,
@@ -695,17 +749,22 @@ class Timer(Receiver[timedelta]):
         Raises:
             ReceiverStoppedError: If the timer was stopped via `stop()`.
         """
+        drift = self._current_drift
         # If it was stopped and there it no pending result, we raise
         # (if there is a pending result, then we still want to return it first)
-        if self._stopped and self._current_drift is None:
+        if drift is None and self._stopped:
             raise ReceiverStoppedError(self)
 
         assert (
-            self._current_drift is not None
+            drift is not None
         ), "calls to `consume()` must be follow a call to `ready()`"
-        drift = self._current_drift
         self._current_drift = None
-        return drift
+        return timedelta(microseconds=drift)
+
+    def _wake_up_ready(self) -> None:
+        """Wake up all pending `ready()` calls to re-evaluate the timer state."""
+        for wakeup in self._wakeups:
+            _set_result_unless_done(wakeup)
 
     def _now(self) -> int:
         """Return the current monotonic clock time in microseconds.
@@ -713,7 +772,7 @@ class Timer(Receiver[timedelta]):
         Returns:
             The current monotonic clock time in microseconds.
         """
-        return _to_microseconds(self._loop.time())
+        return round(self._loop.time() * 1_000_000)
 
     def __str__(self) -> str:
         """Return a string representation of this timer."""
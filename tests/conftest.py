@@ -0,0 +1,40 @@
+# License: MIT
+# Copyright © 2023 Frequenz Energy-as-a-Service GmbH
+
+"""Shared fixtures for the tests."""
+
+import asyncio
+
+import async_solipsism
+import pytest
+
+
+class _SolipsismEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    """An event loop policy creating loops that don't interact with the outside world."""
+
+    def new_event_loop(self) -> async_solipsism.EventLoop:
+        """Create a new fake event loop.
+
+        Returns:
+            The new event loop.
+        """
+        return async_solipsism.EventLoop()
+
+
+@pytest.fixture()
+def event_loop_policy(
+    request: pytest.FixtureRequest,
+) -> asyncio.AbstractEventLoopPolicy:
+    """Use loops that don't interact with the outside world for `solipsism` tests.
+
+    Tests that are not marked with `solipsism` use the current event loop policy.
+
+    Args:
+        request: The request for the fixture.
+
+    Returns:
+        The event loop policy to use to create the loops for the tests.
+    """
+    if request.node.get_closest_marker("solipsism") is None:
+        return asyncio.get_event_loop_policy()
+    return _SolipsismEventLoopPolicy()
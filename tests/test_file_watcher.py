@@ -5,7 +5,7 @@
 
 
 import pathlib
-from collections.abc import AsyncGenerator, Iterator, Sequence
+from collections.abc import AsyncGenerator, Sequence
 from typing import Any
 from unittest import mock
 
@@ -15,21 +15,22 @@ import pytest
 from watchfiles import Change
 from watchfiles.main import FileChange
 
+from frequenz.channels import file_watcher as _file_watcher
 from frequenz.channels.file_watcher import Event, EventType, FileWatcher
 
 
 class _FakeAwatch:
     """Fake awatch class to mock the awatch function."""
 
-    def __init__(self, changes: Sequence[FileChange] = ()) -> None:
+    def __init__(self, batches: Sequence[set[FileChange]] = ()) -> None:
         """Create a `_FakeAwatch` instance.
 
         Args:
-            changes: A sequence of file changes to be returned by the fake awatch
-                function.
+            batches: A sequence of batches of file changes to be returned by the fake
+                awatch function.
         """
-        self.changes: Sequence[FileChange] = changes
-        """The sequence of file changes."""
+        self.batches: Sequence[set[FileChange]] = batches
+        """The sequence of batches of file changes."""
 
     async def fake_awatch(
         self, *paths: str, **kwargs: Any  # pylint: disable=unused-argument
@@ -41,22 +42,26 @@ class _FakeAwatch:
             **kwargs: Keyword arguments to pass to the awatch function.
 
         Yields:
-            The file changes in the sequence provided to the constructor.
+            A copy of each batch of file changes provided to the constructor, one at
+                a time, as the watcher consumes the changes from the yielded set.
         """
-        for change in self.changes:
-            yield {change}
+        for batch in self.batches:
+            yield set(batch)
 
 
 @pytest.fixture
-def fake_awatch() -> Iterator[_FakeAwatch]:
-    """Fixture to mock the awatch function."""
+def fake_awatch(monkeypatch: pytest.MonkeyPatch) -> _FakeAwatch:
+    """Fixture to mock the awatch function.
+
+    Args:
+        monkeypatch: The pytest fixture used to replace the awatch function.
+
+    Returns:
+        The fake awatch, which can be used to set the batches of changes to return.
+    """
     fake = _FakeAwatch()
-    with mock.patch(
-        "frequenz.channels.file_watcher.awatch",
-        autospec=True,
-        side_effect=fake.fake_awatch,
-    ):
-        yield fake
+    monkeypatch.setattr(_file_watcher, "awatch", fake.fake_awatch)
+    return fake
 
 
 async def test_file_watcher_receive_updates(
@@ -64,19 +69,23 @@ async def test_file_watcher_receive_updates(
 ) -> None:
     """Test the file watcher receive the expected events."""
     filename = "test-file"
-    changes = (
-        (Change.added, filename),
-        (Change.deleted, filename),
-        (Change.modified, filename),
+    # Several changes in the first batch, so the watcher needs to drain it before
+    # fetching the next one
+    batches = (
+        {(Change.added, filename), (Change.modified, filename)},
+        {(Change.deleted, filename)},
     )
-    fake_awatch.changes = changes
+    fake_awatch.batches = batches
     file_watcher = FileWatcher(paths=[filename])
 
-    for change in changes:
-        recv_changes = await file_watcher.receive()
-        event_type = EventType(change[0])
-        path = pathlib.Path(change[1])
-        assert recv_changes == Event(type=event_type, path=path)
+    path = pathlib.Path(filename)
+    for batch in batches:
+        expected_events = {
+            Event(type=EventType(change), path=path) for change, _ in batch
+        }
+        # The changes in a batch come in a set, so they can be received in any order
+        received_events = {await file_watcher.receive() for _ in batch}
+        assert received_events == expected_events
 
 
 @hypothesis.given(event_types=st.sets(st.sampled_from(EventType)))
@@ -88,9 +97,7 @@ async def test_file_watcher_filter_events(
 
     # We need to reset the mock explicitly because hypothesis runs all the produced
     # inputs in the same context.
-    with mock.patch(
-        "frequenz.channels.file_watcher.awatch", autospec=True
-    ) as awatch_mock:
+    with mock.patch.object(_file_watcher, "awatch", autospec=True) as awatch_mock:
         file_watcher = FileWatcher(paths=[good_path], event_types=event_types)
 
         filter_events = file_watcher._filter_events  # pylint: disable=protected-access
@@ -104,3 +111,19 @@ async def test_file_watcher_filter_events(
             assert filter_events(event_type.value, good_path) == (
                 event_type in event_types
             )
+
+
+async def test_file_watcher_filter_events_after_update(
+    fake_awatch: _FakeAwatch,  # pylint: disable=redefined-outer-name,unused-argument
+) -> None:
+    """Test the file watcher events filtering follows updates to `event_types`."""
+    file_watcher = FileWatcher(paths=["file"], event_types={EventType.CREATE})
+    filter_events = file_watcher._filter_events  # pylint: disable=protected-access
+    assert filter_events(Change.added, "file")
+    assert not filter_events(Change.deleted, "file")
+
+    file_watcher.event_types = frozenset({EventType.DELETE})
+
+    assert file_watcher.event_types == {EventType.DELETE}
+    assert not filter_events(Change.added, "file")
+    assert filter_events(Change.deleted, "file")
@@ -61,6 +61,7 @@ async def test_file_watcher_deletes(tmp_path: pathlib.Path) -> None:
     number_of_write = 0
     number_of_deletes = 0
     number_of_events = 0
+    file_exists = False
     # We want to write to a file and then removed, and then write again (create it
     # again) and remove it again and then stop.
     # Because awatch takes some time to get notified by the OS, we need to stop writing
@@ -83,12 +84,14 @@ async def test_file_watcher_deletes(tmp_path: pathlib.Path) -> None:
             if number_of_write >= 2 and number_of_events == 0:
                 continue
             filename.write_text(f"{selected.message}")
+            file_exists = True
             number_of_write += 1
         elif selected_from(selected, deletion_timer):
             # Avoid removing the file twice
-            if not pathlib.Path(filename).is_file():
+            if not file_exists:
                 continue
             os.remove(filename)
+            file_exists = False
             number_of_deletes += 1
         elif selected_from(selected, file_watcher):
             number_of_events += 1
@@ -3,20 +3,58 @@
 
 """Tests for the select implementation."""
 
-from unittest import mock
-
 import pytest
 
 from frequenz.channels import Receiver, ReceiverStoppedError, Selected, selected_from
 
 
+class _StubReceiver(Receiver[int]):
+    """A receiver that is always ready and returns a fixed result when consumed."""
+
+    def __init__(self, *, message: int = 0) -> None:
+        """Initialize this receiver.
+
+        Args:
+            message: The message to return when consumed.
+        """
+        self.message: int = message
+        """The message to return when consumed."""
+
+        self.exception: Exception | None = None
+        """The exception to raise when consumed, if any."""
+
+    async def ready(self) -> bool:
+        """Return immediately, this receiver is always ready.
+
+        Returns:
+            Always `True`.
+        """
+        return True
+
+    def consume(self) -> int:
+        """Return the message or raise the exception, if one was set.
+
+        Returns:
+            The message.
+
+        Raises:
+            Exception: The exception, if one was set.
+        """
+        if self.exception is not None:
+            raise self.exception
+        return self.message
+
+    def __str__(self) -> str:
+        """Return a string representation of this receiver."""
+        return "stub"
+
+
 class TestSelected:
     """Tests for the Selected class."""
 
     def test_with_message(self) -> None:
         """Test selected from a receiver with a message."""
-        recv = mock.MagicMock(spec=Receiver[int])
-        recv.consume.return_value = 42
+        recv = _StubReceiver(message=42)
         selected = Selected[int](recv)
 
         assert selected_from(selected, recv)
@@ -26,9 +64,9 @@ class TestSelected:
 
     def test_with_exception(self) -> None:
         """Test selected from a receiver with an exception."""
-        recv = mock.MagicMock(spec=Receiver[int])
+        recv = _StubReceiver()
         exception = Exception("test")
-        recv.consume.side_effect = exception
+        recv.exception = exception
         selected = Selected[int](recv)
 
         assert selected_from(selected, recv)
@@ -39,16 +77,13 @@ class TestSelected:
 
     def test_with_stopped(self) -> None:
         """Test selected from a stopped receiver."""
-        recv = mock.MagicMock(spec=Receiver[int])
+        recv = _StubReceiver()
         exception = ReceiverStoppedError[int](recv)
-        recv.consume.side_effect = exception
+        recv.exception = exception
         selected = Selected[int](recv)
 
         assert selected_from(selected, recv)
-        with pytest.raises(
-            ReceiverStoppedError,
-            match=r"Receiver <MagicMock spec='_GenericAlias' id='\d+'> was stopped",
-        ):
+        with pytest.raises(ReceiverStoppedError, match=r"^Receiver stub was stopped$"):
             _ = selected.message
         assert selected.exception is exception
         assert selected.was_stopped
@@ -9,10 +9,10 @@ class at a time.
 """
 
 import asyncio
-from collections.abc import AsyncIterator, Iterator
+import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
-import async_solipsism
 import pytest
 
 from frequenz.channels import (
@@ -25,36 +25,36 @@ from frequenz.channels import (
 )
 from frequenz.channels.event import Event
 
+_logger = logging.getLogger(__name__)
+
 
 @pytest.mark.integration
+@pytest.mark.solipsism
 class TestSelect:
     """Tests for the select function."""
 
     recv1: Event
     recv2: Event
     recv3: Event
-    loop: async_solipsism.EventLoop
-
-    @pytest.fixture(autouse=True)
-    def event_loop(
-        self, request: pytest.FixtureRequest
-    ) -> Iterator[async_solipsism.EventLoop]:
-        """Replace the loop with one that doesn't interact with the outside world."""
-        loop = async_solipsism.EventLoop()
-        request.cls.loop = loop
-        yield loop
-        loop.close()
 
     @pytest.fixture()
     async def start_run_ordered_sequence(self) -> AsyncIterator[asyncio.Task[None]]:
-        """Start the run_ordered_sequence method and wait for it to finish.
+        """Start the run_ordered_sequence method and stop it when the test is done.
+
+        If the test finished before the sequence, the rest of the sequence is
+        cancelled instead of being run to completion.
 
         Yields:
             The task running the run_ordered_sequence method.
         """
         sequence_task = asyncio.create_task(self.run_ordered_sequence())
         yield sequence_task
-        await sequence_task
+        if not sequence_task.done():
+            sequence_task.cancel()
+        try:
+            await sequence_task
+        except asyncio.CancelledError:
+            pass
 
     def setup_method(self) -> None:
         """Set up the test."""
@@ -68,7 +68,7 @@ class TestSelect:
         receiver: Receiver[None],
         *,
         at_time: float,
-        expected_pending_tasks: int = -2,
+        expected_pending_tasks: int = 0,
     ) -> None:
         """Assert that the selected event was received from the given receiver.
 
@@ -76,7 +76,7 @@ class TestSelect:
 
         * The receiver didn't raise an exception.
         * The receiver wasn't stopped.
-        * The select loop is still running.
+        * The amount of pending tasks is as expected.
         * It happened at the given time.
 
         Args:
@@ -92,10 +92,10 @@ class TestSelect:
         assert selected.exception is None
         assert not selected.was_stopped
         if expected_pending_tasks > 0:
-            assert len(asyncio.all_tasks(self.loop)) == expected_pending_tasks
+            assert len(asyncio.all_tasks()) == expected_pending_tasks
         elif expected_pending_tasks < 0:
-            assert len(asyncio.all_tasks(self.loop)) > expected_pending_tasks
-        assert self.loop.time() == at_time
+            assert len(asyncio.all_tasks()) > -expected_pending_tasks
+        assert asyncio.get_running_loop().time() == at_time
 
     def assert_receiver_stopped(
         self,
@@ -103,7 +103,7 @@ class TestSelect:
         receiver: Receiver[None],
         *,
         at_time: float,
-        expected_pending_tasks: int = -2,
+        expected_pending_tasks: int = 0,
     ) -> None:
         """Assert that the selected event came from a stopped receiver.
 
@@ -125,63 +125,39 @@ class TestSelect:
         assert isinstance(selected.exception, ReceiverStoppedError)
         assert selected.exception.receiver is receiver
         if expected_pending_tasks > 0:
-            assert len(asyncio.all_tasks(self.loop)) == expected_pending_tasks
+            assert len(asyncio.all_tasks()) == expected_pending_tasks
         elif expected_pending_tasks < 0:
-            assert len(asyncio.all_tasks(self.loop)) > expected_pending_tasks
-        assert self.loop.time() == at_time
+            assert len(asyncio.all_tasks()) > -expected_pending_tasks
+        assert asyncio.get_running_loop().time() == at_time
 
     # We use the loop time (and the sleeps in the run_ordered_sequence method) mainly to
     # ensure we are processing the events in the correct order and we are really
     # following the sequence of events we expect.
 
     async def run_ordered_sequence(self) -> None:
-        """Run the sequence of events to be tested."""
-        print("time = 0")
-        self.recv1.set()
-        await asyncio.sleep(1)
-
-        print("time = 1")
-        self.recv2.set()
-        await asyncio.sleep(1)
-
-        print("time = 2")
-        self.recv3.set()
-        await asyncio.sleep(1)
-
-        print("time = 3")
-        self.recv1.set()
-        await asyncio.sleep(1)
-
-        print("time = 4")
-        self.recv1.set()
-        await asyncio.sleep(1)
-
-        print("time = 5")
-        self.recv3.set()
-        await asyncio.sleep(1)
-
-        print("time = 6")
-        self.recv2.set()
-        await asyncio.sleep(1)
-
-        print("time = 7")
-        self.recv1.stop()
-        await asyncio.sleep(1)
-
-        print("time = 8")
-        self.recv2.set()
-        await asyncio.sleep(1)
+        """Run the sequence of events to be tested.
 
-        print("time = 9")
-        self.recv3.stop()
-        await asyncio.sleep(1)
-
-        print("time = 10")
-        self.recv2.set()
-        await asyncio.sleep(1)
-
-        print("time = 11")
-        self.recv2.stop()
+        Each step happens one second after the previous one, starting at time 0.
+        """
+        steps = (
+            self.recv1.set,
+            self.recv2.set,
+            self.recv3.set,
+            self.recv1.set,
+            self.recv1.set,
+            self.recv3.set,
+            self.recv2.set,
+            self.recv1.stop,
+            self.recv2.set,
+            self.recv3.stop,
+            self.recv2.set,
+            self.recv2.stop,
+        )
+        for time, step in enumerate(steps):
+            if time > 0:
+                await asyncio.sleep(1)
+            _logger.debug("time = %s", time)
+            step()
 
     # pylint: disable=redefined-outer-name
     async def test_select_receives_in_order(
@@ -193,38 +169,26 @@ class TestSelect:
         """Test that the select loop receives events in the correct order."""
         select_iter = select(self.recv1, self.recv2, self.recv3)
 
-        selected = await anext(select_iter)
-        self.assert_received_from(selected, self.recv1, at_time=0)
-
-        selected = await anext(select_iter)
-        self.assert_received_from(selected, self.recv2, at_time=1)
-
-        selected = await anext(select_iter)
-        self.assert_received_from(selected, self.recv3, at_time=2)
-
-        selected = await anext(select_iter)
-        self.assert_received_from(selected, self.recv1, at_time=3)
-
-        selected = await anext(select_iter)
-        self.assert_received_from(selected, self.recv1, at_time=4)
-
-        selected = await anext(select_iter)
-        self.assert_received_from(selected, self.recv3, at_time=5)
-
-        selected = await anext(select_iter)
-        self.assert_received_from(selected, self.recv2, at_time=6)
-
-        selected = await anext(select_iter)
-        self.assert_receiver_stopped(selected, self.recv1, at_time=7)
-
-        selected = await anext(select_iter)
-        self.assert_received_from(selected, self.recv2, at_time=8)
-
-        selected = await anext(select_iter)
-        self.assert_receiver_stopped(selected, self.recv3, at_time=9)
-
-        selected = await anext(select_iter)
-        self.assert_received_from(selected, self.recv2, at_time=10)
+        # The receiver we expect to be selected at each time and whether it is stopped
+        expected = (
+            (self.recv1, False),
+            (self.recv2, False),
+            (self.recv3, False),
+            (self.recv1, False),
+            (self.recv1, False),
+            (self.recv3, False),
+            (self.recv2, False),
+            (self.recv1, True),
+            (self.recv2, False),
+            (self.recv3, True),
+            (self.recv2, False),
+        )
+        for at_time, (receiver, stopped) in enumerate(expected):
+            selected = await anext(select_iter)
+            if stopped:
+                self.assert_receiver_stopped(selected, receiver, at_time=at_time)
+            else:
+                self.assert_received_from(selected, receiver, at_time=at_time)
 
         selected = await anext(select_iter)
         self.assert_receiver_stopped(
@@ -319,39 +283,42 @@ class TestSelect:
 
     @pytest.fixture()
     async def start_run_multiple_ready(self) -> AsyncIterator[asyncio.Task[None]]:
-        """Start the run_multiple_ready method and wait for it to finish.
+        """Start the run_multiple_ready method and stop it when the test is done.
+
+        If the test finished before the sequence, the rest of the sequence is
+        cancelled instead of being run to completion.
 
         Yields:
             The task running the run_multiple_ready method.
         """
         sequence_task = asyncio.create_task(self.run_multiple_ready())
         yield sequence_task
-        await sequence_task
+        if not sequence_task.done():
+            sequence_task.cancel()
+        try:
+            await sequence_task
+        except asyncio.CancelledError:
+            pass
 
     async def run_multiple_ready(self) -> None:
-        """Run a sequence of events with multiple receivers ready."""
-        print("time = 0")
-        self.recv1.set()
-        self.recv2.set()
-        self.recv3.set()
-        await asyncio.sleep(1)
-
-        print("time = 1")
-        self.recv2.set()
-        self.recv3.set()
-        await asyncio.sleep(1)
-
-        print("time = 2")
-        self.recv1.set()
-        self.recv3.set()
-        await asyncio.sleep(1)
-
-        print("time = 3")
-        self.recv1.set()
-        self.recv2.set()
-        await asyncio.sleep(1)
-
-        print("time = 4")
+        """Run a sequence of events with multiple receivers ready.
+
+        The receivers in each group are set at the same time, one second after the
+        previous group, starting at time 0.
+        """
+        groups = (
+            (self.recv1, self.recv2, self.recv3),
+            (self.recv2, self.recv3),
+            (self.recv1, self.recv3),
+            (self.recv1, self.recv2),
+        )
+        for time, receivers in enumerate(groups):
+            _logger.debug("time = %s", time)
+            for receiver in receivers:
+                receiver.set()
+            await asyncio.sleep(1)
+
+        _logger.debug("time = %s", len(groups))
 
     async def test_multiple_ready(
         self,
@@ -361,12 +328,13 @@ class TestSelect:
 
         Also test that the loop waits forever if there are no more receivers ready.
         """
+        loop = asyncio.get_running_loop()
         received: set[str] = set()
-        last_time: float = self.loop.time()
+        last_time: float = loop.time()
         try:
             async with asyncio.timeout(15):
                 async for selected in select(self.recv1, self.recv2, self.recv3):
-                    now = self.loop.time()
+                    now = loop.time()
                     if now != last_time:  # Only check when there was a jump in time
                         match now:
                             case 1:
@@ -401,7 +369,7 @@ class TestSelect:
                     else:
                         assert False, "Should not reach this point"
         except asyncio.TimeoutError:
-            assert self.loop.time() == 15
+            assert loop.time() == 15
             # This happened after time == 3, but the loop never resumes because
             # there is nothing ready, so we need to check it after the timeout.
             assert received == {
@@ -443,6 +411,7 @@ class TestSelect:
             iterations = 0
             while len(asyncio.all_tasks(loop)) > 1 and iterations < 5:
                 await asyncio.sleep(0)
+                iterations += 1
 
             assert len(asyncio.all_tasks(loop)) == 1
 
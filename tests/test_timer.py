@@ -6,7 +6,7 @@
 
 import asyncio
 import enum
-from collections.abc import Iterator
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
 
 import async_solipsism
@@ -21,15 +21,7 @@ from frequenz.channels.timer import (
     TriggerAllMissed,
 )
 
-
-# Setting 'autouse' has no effect as this method replaces the event loop for all tests in the file.
-@pytest.fixture()
-def event_loop() -> Iterator[async_solipsism.EventLoop]:
-    """Replace the loop with one that doesn't interact with the outside world."""
-    loop = async_solipsism.EventLoop()
-    yield loop
-    loop.close()
-
+pytestmark = pytest.mark.solipsism
 
 _max_timedelta_microseconds = (
     int(
@@ -45,9 +37,27 @@ _min_timedelta_microseconds = (
     + 1
 )
 
+
+@st.composite
+def _now_and_scheduled_tick_time(draw: st.DrawFn) -> tuple[int, int]:
+    """Draw a scheduled tick time and a current time that is not before it.
+
+    This generates only valid inputs, instead of discarding the examples where `now`
+    is before the scheduled tick time.
+
+    Args:
+        draw: The function to draw values from other strategies.
+
+    Returns:
+        A tuple with the current time and the scheduled tick time.
+    """
+    scheduled_tick_time = draw(st.integers())
+    now = scheduled_tick_time + draw(st.integers(min_value=0))
+    return now, scheduled_tick_time
+
+
 _calculate_next_tick_time_args = {
-    "now": st.integers(),
-    "scheduled_tick_time": st.integers(),
+    "times": _now_and_scheduled_tick_time(),
     "interval": st.integers(min_value=1, max_value=_max_timedelta_microseconds),
 }
 
@@ -61,11 +71,9 @@ def _assert_tick_is_aligned(
 
 
 @hypothesis.given(**_calculate_next_tick_time_args)
-def test_policy_trigger_all_missed(
-    now: int, scheduled_tick_time: int, interval: int
-) -> None:
+def test_policy_trigger_all_missed(times: tuple[int, int], interval: int) -> None:
     """Test the TriggerAllMissed policy."""
-    hypothesis.assume(now >= scheduled_tick_time)
+    now, scheduled_tick_time = times
     assert (
         TriggerAllMissed().calculate_next_tick_time(
             now=now, interval=interval, scheduled_tick_time=scheduled_tick_time
@@ -74,39 +82,34 @@ def test_policy_trigger_all_missed(
     )
 
 
-def test_policy_trigger_all_missed_examples() -> None:
+@pytest.mark.parametrize(
+    "now, scheduled_tick_time, expected_next_tick_time",
+    [
+        (10_200_000, 9_000_000, 10_000_000),
+        (10_000_000, 9_000_000, 10_000_000),
+        (10_500_000, 1_000_000, 2_000_000),
+    ],
+)
+def test_policy_trigger_all_missed_examples(
+    now: int, scheduled_tick_time: int, expected_next_tick_time: int
+) -> None:
     """Test the TriggerAllMissed policy with minimal examples.
 
     This is just a sanity check to make sure we are not missing to test any important
     properties with the hypothesis tests.
     """
-    policy = TriggerAllMissed()
     assert (
-        policy.calculate_next_tick_time(
-            now=10_200_000, scheduled_tick_time=9_000_000, interval=1_000_000
-        )
-        == 10_000_000
-    )
-    assert (
-        policy.calculate_next_tick_time(
-            now=10_000_000, scheduled_tick_time=9_000_000, interval=1_000_000
-        )
-        == 10_000_000
-    )
-    assert (
-        policy.calculate_next_tick_time(
-            now=10_500_000, scheduled_tick_time=1_000_000, interval=1_000_000
+        TriggerAllMissed().calculate_next_tick_time(
+            now=now, scheduled_tick_time=scheduled_tick_time, interval=1_000_000
         )
-        == 2_000_000
+        == expected_next_tick_time
     )
 
 
 @hypothesis.given(**_calculate_next_tick_time_args)
-def test_policy_skip_missed_and_resync(
-    now: int, scheduled_tick_time: int, interval: int
-) -> None:
+def test_policy_skip_missed_and_resync(times: tuple[int, int], interval: int) -> None:
     """Test the SkipMissedAndResync policy."""
-    hypothesis.assume(now >= scheduled_tick_time)
+    now, scheduled_tick_time = times
 
     next_tick_time = SkipMissedAndResync().calculate_next_tick_time(
         now=now, interval=interval, scheduled_tick_time=scheduled_tick_time
@@ -115,30 +118,27 @@ def test_policy_skip_missed_and_resync(
     _assert_tick_is_aligned(next_tick_time, now, scheduled_tick_time, interval)
 
 
-def test_policy_skip_missed_and_resync_examples() -> None:
+@pytest.mark.parametrize(
+    "now, scheduled_tick_time, expected_next_tick_time",
+    [
+        (10_200_000, 9_000_000, 11_000_000),
+        (10_000_000, 9_000_000, 11_000_000),
+        (10_500_000, 1_000_000, 11_000_000),
+    ],
+)
+def test_policy_skip_missed_and_resync_examples(
+    now: int, scheduled_tick_time: int, expected_next_tick_time: int
+) -> None:
     """Test the SkipMissedAndResync policy with minimal examples.
 
     This is just a sanity check to make sure we are not missing to test any important
     properties with the hypothesis tests.
     """
-    policy = SkipMissedAndResync()
-    assert (
-        policy.calculate_next_tick_time(
-            now=10_200_000, scheduled_tick_time=9_000_000, interval=1_000_000
-        )
-        == 11_000_000
-    )
-    assert (
-        policy.calculate_next_tick_time(
-            now=10_000_000, scheduled_tick_time=9_000_000, interval=1_000_000
-        )
-        == 11_000_000
-    )
     assert (
-        policy.calculate_next_tick_time(
-            now=10_500_000, scheduled_tick_time=1_000_000, interval=1_000_000
+        SkipMissedAndResync().calculate_next_tick_time(
+            now=now, scheduled_tick_time=scheduled_tick_time, interval=1_000_000
         )
-        == 11_000_000
+        == expected_next_tick_time
     )
 
 
@@ -156,10 +156,10 @@ def test_policy_skip_missed_and_drift_invalid_tolerance(tolerance: int) -> None:
     **_calculate_next_tick_time_args,
 )
 def test_policy_skip_missed_and_drift(
-    tolerance: int, now: int, scheduled_tick_time: int, interval: int
+    tolerance: int, times: tuple[int, int], interval: int
 ) -> None:
     """Test the SkipMissedAndDrift policy."""
-    hypothesis.assume(now >= scheduled_tick_time)
+    now, scheduled_tick_time = times
 
     next_tick_time = SkipMissedAndDrift(
         delay_tolerance=timedelta(microseconds=tolerance)
@@ -175,39 +175,30 @@ def test_policy_skip_missed_and_drift(
         _assert_tick_is_aligned(next_tick_time, now, scheduled_tick_time, interval)
 
 
-def test_policy_skip_missed_and_drift_examples() -> None:
+@pytest.mark.parametrize(
+    "now, scheduled_tick_time, expected_next_tick_time",
+    [
+        (10_200_000, 9_000_000, 11_200_000),
+        (10_000_000, 9_000_000, 11_000_000),
+        (10_500_000, 1_000_000, 11_500_000),
+        # Exactly at the tolerance, so it is not considered drift yet
+        (10_000_000 + 100_000, 10_000_000, 11_000_000),
+    ],
+)
+def test_policy_skip_missed_and_drift_examples(
+    now: int, scheduled_tick_time: int, expected_next_tick_time: int
+) -> None:
     """Test the SkipMissedAndDrift policy with minimal examples.
 
     This is just a sanity check to make sure we are not missing to test any important
     properties with the hypothesis tests.
     """
-    tolerance = 100_000
-    policy = SkipMissedAndDrift(delay_tolerance=timedelta(microseconds=tolerance))
+    policy = SkipMissedAndDrift(delay_tolerance=timedelta(microseconds=100_000))
     assert (
         policy.calculate_next_tick_time(
-            now=10_200_000, scheduled_tick_time=9_000_000, interval=1_000_000
+            now=now, scheduled_tick_time=scheduled_tick_time, interval=1_000_000
         )
-        == 11_200_000
-    )
-    assert (
-        policy.calculate_next_tick_time(
-            now=10_000_000, scheduled_tick_time=9_000_000, interval=1_000_000
-        )
-        == 11_000_000
-    )
-    assert (
-        policy.calculate_next_tick_time(
-            now=10_500_000, scheduled_tick_time=1_000_000, interval=1_000_000
-        )
-        == 11_500_000
-    )
-    assert (
-        policy.calculate_next_tick_time(
-            now=10_000_000 + tolerance,
-            scheduled_tick_time=10_000_000,
-            interval=1_000_000,
-        )
-        == 11_000_000
+        == expected_next_tick_time
     )
 
 
@@ -236,34 +227,20 @@ def test_timer_construction_no_event_loop() -> None:
         Timer(timedelta(seconds=1.0), TriggerAllMissed())
 
 
-async def test_timer_construction_auto_start() -> None:
-    """Test the construction of a periodic timer with auto_start=False."""
-    policy = TriggerAllMissed()
-    timer = Timer(
-        timedelta(seconds=5.0),
-        policy,
-        auto_start=False,
-        loop=None,
-    )
-    assert timer.interval == timedelta(seconds=5.0)
-    assert timer.missed_tick_policy is policy
-    assert timer.loop is asyncio.get_running_loop()
-    assert timer.is_running is False
-
-
-async def test_timer_construction_custom_args() -> None:
-    """Test the construction of a periodic timer with custom arguments."""
+@pytest.mark.parametrize("auto_start", [True, False])
+async def test_timer_construction_auto_start(auto_start: bool) -> None:
+    """Test that the timer is started or not depending on `auto_start`."""
     policy = TriggerAllMissed()
     timer = Timer(
         timedelta(seconds=5.0),
         policy,
-        auto_start=True,
+        auto_start=auto_start,
         loop=None,
     )
     assert timer.interval == timedelta(seconds=5.0)
     assert timer.missed_tick_policy is policy
     assert timer.loop is asyncio.get_running_loop()
-    assert timer.is_running is True
+    assert timer.is_running is auto_start
 
 
 async def test_timer_construction_wrong_args() -> None:
@@ -304,10 +281,9 @@ async def test_timer_construction_wrong_args() -> None:
         )
 
 
-async def test_timer_autostart(
-    event_loop: async_solipsism.EventLoop,  # pylint: disable=redefined-outer-name
-) -> None:
+async def test_timer_autostart() -> None:
     """Test the autostart of a periodic timer."""
+    loop = asyncio.get_running_loop()
     timer = Timer(timedelta(seconds=1.0), TriggerAllMissed())
 
     # We sleep some time, less than the interval, and then receive from the
@@ -315,14 +291,13 @@ async def test_timer_autostart(
     # time 1.0 without any drift
     await asyncio.sleep(0.5)
     drift = await timer.receive()
-    assert drift == pytest.approx(timedelta(seconds=0.0))
-    assert event_loop.time() == pytest.approx(1.0)
+    assert drift == timedelta(seconds=0.0)
+    assert loop.time() == pytest.approx(1.0)
 
 
-async def test_timer_autostart_with_delay(
-    event_loop: async_solipsism.EventLoop,  # pylint: disable=redefined-outer-name
-) -> None:
+async def test_timer_autostart_with_delay() -> None:
     """Test the autostart of a periodic timer with a delay."""
+    loop = asyncio.get_running_loop()
     timer = Timer(
         timedelta(seconds=1.0), TriggerAllMissed(), start_delay=timedelta(seconds=0.5)
     )
@@ -332,13 +307,13 @@ async def test_timer_autostart_with_delay(
     # time 1.5 without any drift
     await asyncio.sleep(1.2)
     drift = await timer.receive()
-    assert drift == pytest.approx(timedelta(seconds=0.0))
-    assert event_loop.time() == pytest.approx(1.5)
+    assert drift == timedelta(seconds=0.0)
+    assert loop.time() == pytest.approx(1.5)
 
     # Still the next tick should be at 2.5 (every second)
     drift = await timer.receive()
-    assert drift == pytest.approx(timedelta(seconds=0.0))
-    assert event_loop.time() == pytest.approx(2.5)
+    assert drift == timedelta(seconds=0.0)
+    assert loop.time() == pytest.approx(2.5)
 
 
 class _StartMethod(enum.Enum):
@@ -348,12 +323,38 @@ class _StartMethod(enum.Enum):
     ASYNC_ITERATOR = enum.auto()
 
 
+async def _start_with_reset(timer: Timer) -> timedelta:
+    timer.reset()
+    return await timer.receive()
+
+
+async def _start_with_receive(timer: Timer) -> timedelta:
+    return await timer.receive()
+
+
+async def _start_with_ready(timer: Timer) -> timedelta:
+    assert await timer.ready() is True
+    return timer.consume()
+
+
+async def _start_with_async_iterator(timer: Timer) -> timedelta:
+    async for drift in timer:
+        return drift
+    assert False, "The timer should have triggered"
+
+
+_START_METHODS: dict[_StartMethod, Callable[[Timer], Awaitable[timedelta]]] = {
+    _StartMethod.RESET: _start_with_reset,
+    _StartMethod.RECEIVE: _start_with_receive,
+    _StartMethod.READY: _start_with_ready,
+    _StartMethod.ASYNC_ITERATOR: _start_with_async_iterator,
+}
+
+
 @pytest.mark.parametrize("start_method", list(_StartMethod))
-async def test_timer_no_autostart(
-    start_method: _StartMethod,
-    event_loop: async_solipsism.EventLoop,  # pylint: disable=redefined-outer-name
-) -> None:
+async def test_timer_no_autostart(start_method: _StartMethod) -> None:
     """Test a periodic timer when it is not automatically started."""
+    loop = asyncio.get_running_loop()
     timer = Timer(
         timedelta(seconds=1.0),
         TriggerAllMissed(),
@@ -364,59 +365,91 @@ async def test_timer_no_autostart(
     # receive from it, since it wasn't automatically started, it should trigger
     # shifted by the sleep time (without any drift)
     await asyncio.sleep(0.5)
-    drift: timedelta | None = None
-    if start_method == _StartMethod.RESET:
-        timer.reset()
-        drift = await timer.receive()
-    elif start_method == _StartMethod.RECEIVE:
-        drift = await timer.receive()
-    elif start_method == _StartMethod.READY:
-        assert await timer.ready() is True
-        drift = timer.consume()
-    elif start_method == _StartMethod.ASYNC_ITERATOR:
-        async for _drift in timer:
-            drift = _drift
-            break
-    else:
-        assert False, f"Unknown start method {start_method}"
+    drift = await _START_METHODS[start_method](timer)
 
-    assert drift == pytest.approx(timedelta(seconds=0.0))
-    assert event_loop.time() == pytest.approx(1.5)
+    assert drift == timedelta(seconds=0.0)
+    assert loop.time() == pytest.approx(1.5)
 
 
-async def test_timer_trigger_all_missed(
-    event_loop: async_solipsism.EventLoop,  # pylint: disable=redefined-outer-name
-) -> None:
+async def test_timer_stop_while_waiting() -> None:
+    """Test that stopping a timer wakes up a pending `ready()` immediately."""
+    loop = asyncio.get_running_loop()
+    timer = Timer(timedelta(seconds=1.0), TriggerAllMissed())
+
+    ready_task = asyncio.create_task(timer.ready())
+    await asyncio.sleep(0.5)
+    timer.stop()
+
+    assert await ready_task is False
+    assert loop.time() == pytest.approx(0.5)
+
+
+async def test_timer_stop_while_waiting_concurrently() -> None:
+    """Test that stopping a timer wakes up all pending `ready()` calls."""
+    loop = asyncio.get_running_loop()
+    timer = Timer(timedelta(seconds=100.0), TriggerAllMissed())
+
+    ready_tasks = [asyncio.create_task(timer.ready()) for _ in range(3)]
+    await asyncio.sleep(0.5)
+    # A waiter going away must not stop the others from being woken up
+    ready_tasks[0].cancel()
+    await asyncio.sleep(0.5)
+    timer.stop()
+
+    assert await asyncio.gather(*ready_tasks[1:]) == [False, False]
+    assert ready_tasks[0].cancelled()
+    assert loop.time() == pytest.approx(1.0)
+
+
+async def test_timer_reset_while_waiting() -> None:
+    """Test that resetting a timer re-schedules a pending `ready()`."""
+    loop = asyncio.get_running_loop()
+    timer = Timer(
+        timedelta(seconds=1.0), TriggerAllMissed(), start_delay=timedelta(seconds=5.0)
+    )
+
+    ready_task = asyncio.create_task(timer.ready())
+    await asyncio.sleep(1.0)
+    # The next tick was due at 6.0, now it should be due at 2.0
+    timer.reset()
+
+    assert await ready_task is True
+    assert loop.time() == pytest.approx(2.0)
+    assert timer.consume() == timedelta(seconds=0.0)
+
+
+async def test_timer_trigger_all_missed() -> None:
     """Test a timer using the TriggerAllMissed policy."""
+    loop = asyncio.get_running_loop()
     interval = 1.0
     timer = Timer(timedelta(seconds=interval), TriggerAllMissed())
 
     # We let the first tick be triggered on time
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval)
-    assert drift == pytest.approx(timedelta(seconds=0.0))
+    assert loop.time() == pytest.approx(interval)
+    assert drift == timedelta(seconds=0.0)
 
     # Now we let the time pass interval plus a bit more, so we should get
     # a drift, but the next tick should be triggered still at a multiple of the
     # interval because we are using TRIGGER_ALL.
     await asyncio.sleep(interval + 0.1)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 2 + 0.1)
-    assert drift == pytest.approx(timedelta(seconds=0.1))
+    assert loop.time() == pytest.approx(interval * 2 + 0.1)
+    assert drift == timedelta(seconds=0.1)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 3)
-    assert drift == pytest.approx(timedelta(seconds=0.0))
+    assert loop.time() == pytest.approx(interval * 3)
+    assert drift == timedelta(seconds=0.0)
 
     # Now we let the time pass by two times the interval, so we should get
     # a drift of a whole interval and then next tick should be triggered
     # immediately with no drift, because we are still at an interval boundary.
     await asyncio.sleep(2 * interval)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 5)
-    assert drift == pytest.approx(timedelta(seconds=interval))
+    assert loop.time() == pytest.approx(interval * 5)
+    assert drift == timedelta(seconds=interval)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 5)
-    assert drift == pytest.approx(timedelta(seconds=0.0))
+    assert loop.time() == pytest.approx(interval * 5)
+    assert drift == timedelta(seconds=0.0)
 
     # Finally we let the time pass by 5 times the interval plus some extra
     # delay (even when the tolerance should be irrelevant for this mode),
@@ -426,58 +459,57 @@ async def test_timer_trigger_all_missed(
     extra_delay = 0.1
     await asyncio.sleep(5 * interval + extra_delay)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 10 + extra_delay)
-    assert drift == pytest.approx(timedelta(seconds=interval * 4 + extra_delay))
+    assert loop.time() == pytest.approx(interval * 10 + extra_delay)
+    assert drift == timedelta(seconds=interval * 4 + extra_delay)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 10 + extra_delay)
-    assert drift == pytest.approx(timedelta(seconds=interval * 3 + extra_delay))
+    assert loop.time() == pytest.approx(interval * 10 + extra_delay)
+    assert drift == timedelta(seconds=interval * 3 + extra_delay)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 10 + extra_delay)
-    assert drift == pytest.approx(timedelta(seconds=interval * 2 + extra_delay))
+    assert loop.time() == pytest.approx(interval * 10 + extra_delay)
+    assert drift == timedelta(seconds=interval * 2 + extra_delay)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 10 + extra_delay)
-    assert drift == pytest.approx(timedelta(seconds=interval * 1 + extra_delay))
+    assert loop.time() == pytest.approx(interval * 10 + extra_delay)
+    assert drift == timedelta(seconds=interval * 1 + extra_delay)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 10 + extra_delay)
-    assert drift == pytest.approx(timedelta(seconds=interval * 0 + extra_delay))
+    assert loop.time() == pytest.approx(interval * 10 + extra_delay)
+    assert drift == timedelta(seconds=interval * 0 + extra_delay)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 11)
-    assert drift == pytest.approx(timedelta(seconds=0.0))
+    assert loop.time() == pytest.approx(interval * 11)
+    assert drift == timedelta(seconds=0.0)
 
 
-async def test_timer_skip_missed_and_resync(
-    event_loop: async_solipsism.EventLoop,  # pylint: disable=redefined-outer-name
-) -> None:
+async def test_timer_skip_missed_and_resync() -> None:
     """Test a timer using the SkipMissedAndResync policy."""
+    loop = asyncio.get_running_loop()
     interval = 1.0
     timer = Timer(timedelta(seconds=interval), SkipMissedAndResync())
 
     # We let the first tick be triggered on time
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval)
-    assert drift == pytest.approx(timedelta(seconds=0.0))
+    assert loop.time() == pytest.approx(interval)
+    assert drift == timedelta(seconds=0.0)
 
     # Now we let the time pass interval plus a bit more, so we should get
     # a drift, but the next tick should be triggered still at a multiple of the
     # interval because we are using TRIGGER_ALL.
     await asyncio.sleep(interval + 0.1)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 2 + 0.1)
-    assert drift == pytest.approx(timedelta(seconds=0.1))
+    assert loop.time() == pytest.approx(interval * 2 + 0.1)
+    assert drift == timedelta(seconds=0.1)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 3)
-    assert drift == pytest.approx(timedelta(seconds=0.0))
+    assert loop.time() == pytest.approx(interval * 3)
+    assert drift == timedelta(seconds=0.0)
 
     # Now we let the time pass by two times the interval, so we should get
     # a drift of a whole interval and then next tick should an interval later,
     # as the delayed tick will be skipped and the timer will resync.
     await asyncio.sleep(2 * interval)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 5)
-    assert drift == pytest.approx(timedelta(seconds=interval))
+    assert loop.time() == pytest.approx(interval * 5)
+    assert drift == timedelta(seconds=interval)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 6)
-    assert drift == pytest.approx(timedelta(seconds=0.0))
+    assert loop.time() == pytest.approx(interval * 6)
+    assert drift == timedelta(seconds=0.0)
 
     # Finally we let the time pass by 5 times the interval plus some extra
     # delay. The timer should fire immediately once with a drift of 4 intervals
@@ -486,20 +518,19 @@ async def test_timer_skip_missed_and_resync(
     extra_delay = 0.8
     await asyncio.sleep(5 * interval + extra_delay)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 11 + extra_delay)
-    assert drift == pytest.approx(timedelta(seconds=interval * 4 + extra_delay))
+    assert loop.time() == pytest.approx(interval * 11 + extra_delay)
+    assert drift == timedelta(seconds=interval * 4 + extra_delay)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 12)
-    assert drift == pytest.approx(timedelta(seconds=0.0))
+    assert loop.time() == pytest.approx(interval * 12)
+    assert drift == timedelta(seconds=0.0)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 13)
-    assert drift == pytest.approx(timedelta(seconds=0.0))
+    assert loop.time() == pytest.approx(interval * 13)
+    assert drift == timedelta(seconds=0.0)
 
 
-async def test_timer_skip_missed_and_drift(
-    event_loop: async_solipsism.EventLoop,  # pylint: disable=redefined-outer-name
-) -> None:
+async def test_timer_skip_missed_and_drift() -> None:
     """Test a timer using the SkipMissedAndDrift policy."""
+    loop = asyncio.get_running_loop()
     interval = 1.0
     tolerance = 0.1
     timer = Timer(
@@ -509,7 +540,7 @@ async def test_timer_skip_missed_and_drift(
 
     # We let the first tick be triggered on time
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval)
+    assert loop.time() == pytest.approx(interval)
     assert drift == timedelta(seconds=0.0)
 
     # Now we let the time pass by the interval plus the tolerance so the drift
@@ -517,22 +548,22 @@ async def test_timer_skip_missed_and_drift(
     # a multiple of the interval.
     await asyncio.sleep(interval + tolerance)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 2 + tolerance)
-    assert drift == pytest.approx(timedelta(seconds=tolerance))
+    assert loop.time() == pytest.approx(interval * 2 + tolerance)
+    assert drift == timedelta(seconds=tolerance)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 3)
-    assert drift == pytest.approx(timedelta(seconds=0.0))
+    assert loop.time() == pytest.approx(interval * 3)
+    assert drift == timedelta(seconds=0.0)
 
     # Now we let the time pass the interval plus two times the tolerance. Now
     # the timer should start to drift, and the next tick should be triggered at
     # a multiple of the interval plus the shift of two times the tolerance.
     await asyncio.sleep(interval + tolerance * 2)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 4 + tolerance * 2)
-    assert drift == pytest.approx(timedelta(seconds=tolerance * 2))
+    assert loop.time() == pytest.approx(interval * 4 + tolerance * 2)
+    assert drift == timedelta(seconds=tolerance * 2)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 5 + tolerance * 2)
-    assert drift == pytest.approx(timedelta(seconds=0.0))
+    assert loop.time() == pytest.approx(interval * 5 + tolerance * 2)
+    assert drift == timedelta(seconds=0.0)
 
     # Now we let the time pass by two times the interval, so we should missed
     # one tick (the tick at time = 6 + tolerance * 2) and the next tick should
@@ -541,11 +572,11 @@ async def test_timer_skip_missed_and_drift(
     # to the shifted interval.
     await asyncio.sleep(2 * interval)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 7 + tolerance * 2)
-    assert drift == pytest.approx(timedelta(seconds=interval))
+    assert loop.time() == pytest.approx(interval * 7 + tolerance * 2)
+    assert drift == timedelta(seconds=interval)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 8 + tolerance * 2)
-    assert drift == pytest.approx(timedelta(seconds=0.0))
+    assert loop.time() == pytest.approx(interval * 8 + tolerance * 2)
+    assert drift == timedelta(seconds=0.0)
 
     # Finally we let the time pass by 5 times the interval plus a tiny bit more
     # than the tolerance, so we should missed 4 ticks (the ticks at times 9+,
@@ -553,8 +584,8 @@ async def test_timer_skip_missed_and_drift(
     # tolerance, so the next tick should accumulate the drift again.
     await asyncio.sleep(5 * interval + tolerance + 0.001)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 13 + tolerance * 3 + 0.001)
-    assert drift == pytest.approx(timedelta(seconds=interval * 4 + tolerance + 0.001))
+    assert loop.time() == pytest.approx(interval * 13 + tolerance * 3 + 0.001)
+    assert drift == timedelta(seconds=interval * 4 + tolerance + 0.001)
     drift = await timer.receive()
-    assert event_loop.time() == pytest.approx(interval * 14 + tolerance * 3 + 0.001)
-    assert drift == pytest.approx(timedelta(seconds=0.0))
+    assert loop.time() == pytest.approx(interval * 14 + tolerance * 3 + 0.001)
+    assert drift == timedelta(seconds=0.0)